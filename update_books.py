@@ -5,22 +5,56 @@ Enhanced Book List Update Script with Logging
 This script helps you quickly commit and push changes to your book list
 while automatically tracking changes in a log file.
 
-Usage: python update_books.py [commit message]
+Usage: python update_books.py [--quiet] [commit message]
 
 Features:
 - Automatically detects book additions, removals, and status changes
-- Creates detailed logs in books_log.json
+- Creates detailed logs in books_log.jsonl
 - Supports rollback functionality
 - Generates commit messages based on detected changes
 """
 
+import atexit
 import subprocess
 import sys
 import os
-import json
-import re
-from datetime import datetime
-from typing import Dict, List, Tuple, Set
+
+# json, re and datetime are imported where they are used so that --help,
+# --debug and the "no changes" path don't pay for them at startup.
+
+# Regex to match book entries: - [x] **Title** by *Author*
+# Compiled on first use by _book_re() / _book_re_bytes()
+# Negated classes stop at the closing '*' without backtracking and can't
+# run on into the next line
+_BOOK_PATTERN = r'- \[([ x])\] \*\*([^*\n]+)\*\* by \*([^*\n]+)\*'
+_BOOK_RE = None
+_BOOK_RE_BYTES = None
+
+def _book_re():
+    """Return the compiled book entry regex, compiling it on first use"""
+    global _BOOK_RE
+    if _BOOK_RE is None:
+        import re
+        _BOOK_RE = re.compile(_BOOK_PATTERN)
+    return _BOOK_RE
+
+def _book_re_bytes():
+    """Return the book entry regex compiled for bytes input"""
+    global _BOOK_RE_BYTES
+    if _BOOK_RE_BYTES is None:
+        import re
+        _BOOK_RE_BYTES = re.compile(_BOOK_PATTERN.encode('ascii'))
+    return _BOOK_RE_BYTES
+
+# Commit message fragment for each change type, in the order they are joined
+_COMMIT_MESSAGE_PARTS = [
+    ('books_bought', "📚 Bought {count} {books}"),
+    ('books_added_to_wanted', "🛒 Added {count} {books} to wishlist"),
+    ('books_added_to_owned', "📖 Added {count} owned {books}"),
+    ('books_removed_from_wanted', "🗑️ Removed {count} {books} from wishlist"),
+    ('books_removed_from_owned', "📤 Removed {count} owned {books}"),
+    ('books_returned', "↩️ Returned {count} {books}"),
+]
 
 # ANSI color codes for pretty output
 class Colors:
@@ -35,28 +69,29 @@ class Colors:
 
 class BookTracker:
     def __init__(self):
-        self.log_file = 'books_log.json'
+        self.log_file = 'books_log.jsonl'
         self.books_file = 'books.md'
         self.current_books = {'wanted': set(), 'owned': set()}
         self.previous_books = {'wanted': set(), 'owned': set()}
+        self._cat_file = None  # persistent `git cat-file --batch` process
+        self._books_stat = None  # os.stat of books.md from check_prerequisites
         
     def log(self, message, color=Colors.RESET):
         """Print colored message to console"""
         print(f"{color}{message}{Colors.RESET}")
 
     def run_command(self, command, description, capture_output=True):
-        """Run a shell command and handle errors"""
+        """Run a command given as an argv list and handle errors"""
         try:
             if description:
                 self.log(f"{Colors.BLUE}{description}...{Colors.RESET}")
             result = subprocess.run(
                 command, 
-                shell=True, 
                 capture_output=capture_output, 
                 text=True, 
                 check=True
             )
-            if result.stdout.strip() and capture_output:
+            if capture_output and result.stdout.strip():
                 print(result.stdout.strip())
             return result.stdout if capture_output else True
         except subprocess.CalledProcessError as e:
@@ -64,17 +99,21 @@ class BookTracker:
             if error_msg:
                 self.log(f"❌ Error: {error_msg}", Colors.RED)
             else:
-                self.log(f"❌ Command failed: {command}", Colors.RED)
+                self.log(f"❌ Command failed: {' '.join(command)}", Colors.RED)
+            return None
+        except OSError as e:
+            # e.g. the program is not on PATH; there is no shell to report it
+            self.log(f"❌ Error: {e}", Colors.RED)
             return None
 
-    def parse_books_from_markdown(self, content: str) -> Dict[str, Set[str]]:
+    def parse_books_from_markdown(self, content: str) -> dict[str, set[str]]:
         """Extract books from markdown content"""
+        return self.books_from_matches(_book_re().findall(content))
+
+    def books_from_matches(self, matches) -> dict[str, set[str]]:
+        """Sort (status, title, author) string tuples into wanted/owned sets"""
         books = {'wanted': set(), 'owned': set()}
         
-        # Regex to match book entries: - [x] **Title** by *Author*
-        pattern = r'- \[([ x])\] \*\*(.*?)\*\* by \*(.*?)\*'
-        matches = re.findall(pattern, content)
-        
         for status, title, author in matches:
             book_entry = f"{title} by {author}"
             if status == 'x':
@@ -84,112 +123,164 @@ class BookTracker:
         
         return books
 
-    def get_current_books(self) -> Dict[str, Set[str]]:
+    def get_current_books(self) -> dict[str, set[str]]:
         """Get current books from the markdown file"""
+        import mmap
+        books = {'wanted': set(), 'owned': set()}
         try:
-            with open(self.books_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return self.parse_books_from_markdown(content)
+            with open(self.books_file, 'rb') as f:
+                # Reuse the stat from check_prerequisites when we have one.
+                # mmap refuses empty files, and there are no books in them anyway
+                books_stat = self._books_stat or os.fstat(f.fileno())
+                if books_stat.st_size == 0:
+                    return books
+                # Match directly against the mapped bytes so the file is never
+                # copied or decoded as a whole; only captured groups are decoded
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self.books_from_matches(
+                        tuple(group.decode('utf-8') for group in match.groups())
+                        for match in _book_re_bytes().finditer(mm)
+                    )
         except FileNotFoundError:
             self.log(f"❌ {self.books_file} not found", Colors.RED)
             return {'wanted': set(), 'owned': set()}
 
-    def get_previous_books(self) -> Dict[str, Set[str]]:
+    def read_git_object(self, revision: str):
+        """Read a blob such as 'HEAD:books.md' from git history, or None if missing"""
+        # One `git cat-file --batch` process is started on first use and
+        # reused for later lookups
+        if self._cat_file is None:
+            self._cat_file = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+            atexit.register(self.close_git_objects)
+        
+        self._cat_file.stdin.write(f"{revision}\n".encode('utf-8'))
+        self._cat_file.stdin.flush()
+        
+        # Header is "<sha> <type> <size>", or "<name> missing" on failure
+        header = self._cat_file.stdout.readline().split()
+        if len(header) != 3:
+            return None
+        
+        # Payload is followed by a single newline. Always consume it, even for
+        # non-blob objects, so the next lookup starts at its own header
+        data = self._cat_file.stdout.read(int(header[2]) + 1)
+        if header[1] != b'blob':
+            return None
+        return data[:-1].decode('utf-8')
+
+    def close_git_objects(self):
+        """Shut down the `git cat-file --batch` process if it was started"""
+        if self._cat_file is not None:
+            self._cat_file.stdin.close()
+            self._cat_file.wait()
+            self._cat_file.stdout.close()
+            self._cat_file = None
+
+    def get_previous_books(self) -> dict[str, set[str]]:
         """Get previous books from git history"""
         try:
             # Get the last committed version of books.md
-            result = self.run_command(
-                f"git show HEAD:{self.books_file}", 
-                None, 
-                capture_output=True
-            )
+            result = self.read_git_object(f"HEAD:{self.books_file}")
             if result:
                 return self.parse_books_from_markdown(result)
-        except:
+        except (OSError, ValueError):
+            # git missing or exited (OSError/BrokenPipeError), or an
+            # unexpected header or non-UTF-8 content (ValueError)
             pass
         return {'wanted': set(), 'owned': set()}
 
-    def detect_changes(self) -> Dict[str, List[str]]:
+    def detect_changes(self) -> dict[str, list[str]]:
         """Detect what changed between previous and current book lists"""
-        self.current_books = self.get_current_books()
-        self.previous_books = self.get_previous_books()
-        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # The two reads are independent: overlap the git lookup with parsing
+        # the working copy
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current = executor.submit(self.get_current_books)
+            previous = executor.submit(self.get_previous_books)
+            self.current_books = current.result()
+            self.previous_books = previous.result()
+        
+        cur_wanted, cur_owned = self.current_books['wanted'], self.current_books['owned']
+        prev_wanted, prev_owned = self.previous_books['wanted'], self.previous_books['owned']
+        
+        # Find additions and removals, keeping everything as sets until the end
+        added_wanted = cur_wanted - prev_wanted
+        removed_wanted = prev_wanted - cur_wanted
+        added_owned = cur_owned - prev_owned
+        removed_owned = prev_owned - cur_owned
+        
+        # Books that moved from wanted to owned (bought)
+        bought = added_owned & removed_wanted
+        # Books that moved from owned to wanted (returned/sold)
+        returned = added_wanted & removed_owned
+        
+        # Moved books are excluded from the regular additions/removals
         changes = {
-            'books_added_to_wanted': [],
-            'books_removed_from_wanted': [],
-            'books_added_to_owned': [],
-            'books_removed_from_owned': [],
-            'books_bought': [],  # moved from wanted to owned
-            'books_returned': [] # moved from owned to wanted
+            'books_added_to_wanted': list(added_wanted - returned),
+            'books_removed_from_wanted': list(removed_wanted - bought),
+            'books_added_to_owned': list(added_owned - bought),
+            'books_removed_from_owned': list(removed_owned - returned),
+            'books_bought': list(bought),
+            'books_returned': list(returned)
         }
         
-        # Find additions and removals
-        changes['books_added_to_wanted'] = list(
-            self.current_books['wanted'] - self.previous_books['wanted']
-        )
-        changes['books_removed_from_wanted'] = list(
-            self.previous_books['wanted'] - self.current_books['wanted']
-        )
-        changes['books_added_to_owned'] = list(
-            self.current_books['owned'] - self.previous_books['owned']
-        )
-        changes['books_removed_from_owned'] = list(
-            self.previous_books['owned'] - self.current_books['owned']
-        )
-        
-        # Detect books that moved from wanted to owned (bought)
-        potential_bought = set(changes['books_added_to_owned']) & set(changes['books_removed_from_wanted'])
-        changes['books_bought'] = list(potential_bought)
-        
-        # Remove bought books from regular additions/removals
-        changes['books_added_to_owned'] = [
-            book for book in changes['books_added_to_owned'] 
-            if book not in potential_bought
-        ]
-        changes['books_removed_from_wanted'] = [
-            book for book in changes['books_removed_from_wanted'] 
-            if book not in potential_bought
-        ]
-        
-        # Detect books that moved from owned to wanted (returned/sold)
-        potential_returned = set(changes['books_added_to_wanted']) & set(changes['books_removed_from_owned'])
-        changes['books_returned'] = list(potential_returned)
-        
-        # Remove returned books from regular additions/removals
-        changes['books_added_to_wanted'] = [
-            book for book in changes['books_added_to_wanted'] 
-            if book not in potential_returned
-        ]
-        changes['books_removed_from_owned'] = [
-            book for book in changes['books_removed_from_owned'] 
-            if book not in potential_returned
-        ]
-        
         return changes
 
-    def load_log(self) -> List[Dict]:
-        """Load existing log entries"""
+    def load_log(self, limit: int = None) -> list[dict]:
+        """Load existing log entries, or only the last `limit` of them
+
+        The log is JSON Lines: one entry per line, oldest first.
+        """
+        import json
+        from collections import deque
+        entries = []
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            # Binary mode skips the text decoding layer; json.loads decodes
+            # each UTF-8 line itself
+            with open(self.log_file, 'rb') as f:
+                # deque keeps only the tail without holding the whole file
+                lines = deque(f, maxlen=limit) if limit else f
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # e.g. a partially written last line; skip it
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
 
-    def save_log(self, log_entries: List[Dict]):
-        """Save log entries to file"""
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            json.dump(log_entries, f, indent=2, ensure_ascii=False)
+    def append_log(self, entry: dict):
+        """Append a single entry to the log file"""
+        # Prefer orjson's C encoder when it is installed; both produce
+        # compact, non-ASCII-preserving JSON on a single line
+        try:
+            import orjson
+            line = orjson.dumps(entry).decode('utf-8')
+        except ImportError:
+            import json
+            line = json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
 
-    def add_log_entry(self, changes: Dict[str, List[str]], commit_message: str):
+    def add_log_entry(self, changes: dict[str, list[str]], commit_message: str):
         """Add a new log entry"""
-        log_entries = self.load_log()
+        from datetime import datetime
         
-        timestamp = datetime.now().isoformat()
+        # Read the clock once so all three fields describe the same instant
+        now = datetime.now()
         
         entry = {
-            'timestamp': timestamp,
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'time': datetime.now().strftime('%H:%M:%S'),
+            'timestamp': now.isoformat(),
+            'date': now.strftime('%Y-%m-%d'),
+            'time': now.strftime('%H:%M:%S'),
             'commit_message': commit_message,
             'changes': changes,
             'totals_after': {
@@ -199,48 +290,28 @@ class BookTracker:
             }
         }
         
-        log_entries.append(entry)
-        self.save_log(log_entries)
+        self.append_log(entry)
         
         return entry
 
-    def generate_commit_message(self, changes: Dict[str, List[str]], custom_message: str = None) -> str:
+    def generate_commit_message(self, changes: dict[str, list[str]], custom_message: str = None) -> str:
         """Generate a commit message based on detected changes"""
         if custom_message:
             return custom_message
         
-        messages = []
-        
-        if changes['books_bought']:
-            count = len(changes['books_bought'])
-            messages.append(f"📚 Bought {count} book{'s' if count > 1 else ''}")
-        
-        if changes['books_added_to_wanted']:
-            count = len(changes['books_added_to_wanted'])
-            messages.append(f"🛒 Added {count} book{'s' if count > 1 else ''} to wishlist")
-        
-        if changes['books_added_to_owned']:
-            count = len(changes['books_added_to_owned'])
-            messages.append(f"📖 Added {count} owned book{'s' if count > 1 else ''}")
-        
-        if changes['books_removed_from_wanted']:
-            count = len(changes['books_removed_from_wanted'])
-            messages.append(f"🗑️ Removed {count} book{'s' if count > 1 else ''} from wishlist")
-        
-        if changes['books_removed_from_owned']:
-            count = len(changes['books_removed_from_owned'])
-            messages.append(f"📤 Removed {count} owned book{'s' if count > 1 else ''}")
-        
-        if changes['books_returned']:
-            count = len(changes['books_returned'])
-            messages.append(f"↩️ Returned {count} book{'s' if count > 1 else ''}")
+        messages = [
+            template.format(count=len(changes[key]), books='books' if len(changes[key]) > 1 else 'book')
+            for key, template in _COMMIT_MESSAGE_PARTS
+            if changes[key]
+        ]
         
         if not messages:
+            from datetime import datetime
             return f"📝 Update book list - {datetime.now().strftime('%b %d, %Y at %I:%M %p')}"
         
         return " • ".join(messages)
 
-    def print_changes_summary(self, changes: Dict[str, List[str]]):
+    def print_changes_summary(self, changes: dict[str, list[str]]):
         """Print a summary of detected changes"""
         self.log(f"\n{Colors.BOLD}📊 Changes Detected:{Colors.RESET}\n")
         
@@ -283,12 +354,14 @@ class BookTracker:
     def check_prerequisites(self) -> bool:
         """Check if all prerequisites are met"""
         # Check if it's a git repository
-        if not self.run_command("git rev-parse --git-dir", None):
+        if not self.run_command(["git", "rev-parse", "--git-dir"], None):
             self.log("❌ This is not a Git repository. Please run 'git init' first.", Colors.RED)
             return False
         
         # Check if books.md exists
-        if not os.path.exists(self.books_file):
+        try:
+            self._books_stat = os.stat(self.books_file)
+        except OSError:
             self.log(f"❌ {self.books_file} file not found. Please create it first.", Colors.RED)
             return False
         
@@ -297,21 +370,27 @@ class BookTracker:
     def has_changes(self) -> bool:
         """Check if there are any uncommitted changes to books.md"""
         try:
-            result = self.run_command(
-                f"git status --porcelain {self.books_file}", 
-                None, 
-                capture_output=True
+            # Path-limited status is cheap and, unlike git diff, also sees a
+            # books.md that has never been committed
+            result = subprocess.run(
+                ["git", "status", "--porcelain", "--", self.books_file],
+                capture_output=True,
+                text=True
             )
-            return bool(result and result.strip())
-        except:
+            return bool(result.stdout.strip())
+        except OSError:
             return False
 
     def has_any_changes(self) -> bool:
-        """Check if there are any uncommitted changes to any files"""
+        """Check if there are any uncommitted changes to tracked files"""
         try:
-            result = self.run_command("git status --porcelain", None)
-            return bool(result and result.strip())
-        except:
+            # The exit code of `git diff --quiet HEAD` covers staged and
+            # unstaged edits with no output to capture. Untracked files are
+            # deliberately ignored. Any git error (exit code 128, usually no
+            # commits yet) counts as changed
+            result = subprocess.run(["git", "diff", "--quiet", "HEAD"], stderr=subprocess.DEVNULL)
+            return result.returncode != 0
+        except OSError:
             return False
 
 def show_help():
@@ -320,16 +399,17 @@ def show_help():
 {Colors.BOLD}📚 Enhanced Book List Update Script{Colors.RESET}
 
 Usage:
-  python update_books.py [commit message]
+  python update_books.py [--quiet] [commit message]
 
 Examples:
   python update_books.py                           # Auto-detects changes and generates message
   python update_books.py "Added 5 new books to wishlist"
   python update_books.py "Finished reading Dune"
+  python update_books.py --quiet "Fix typo"        # Commit as-is, no change log entry
 
 Features:
   • 🔍 Automatically detects book additions, removals, and purchases
-  • 📊 Maintains detailed logs in books_log.json
+  • 📊 Maintains detailed logs in books_log.jsonl
   • 🎯 Generates smart commit messages based on changes
   • 📈 Tracks statistics over time for dashboard integration
 
@@ -352,12 +432,13 @@ Options:
   --log          Show recent log entries
   --stats        Show collection statistics
   --debug        Show git status and file information for troubleshooting
+  --quiet        With a commit message: commit without detecting or logging changes
 """
     print(help_text)
 
 def show_recent_logs(tracker: BookTracker, limit: int = 10):
     """Show recent log entries"""
-    log_entries = tracker.load_log()
+    log_entries = tracker.load_log(limit)
     
     if not log_entries:
         tracker.log("📝 No log entries found.", Colors.YELLOW)
@@ -447,9 +528,9 @@ def main():
     # Check for debug flag
     if '--debug' in sys.argv:
         tracker.log("🔍 Debug mode - showing current git status:", Colors.CYAN)
-        tracker.run_command("git status", None, capture_output=False)
+        tracker.run_command(["git", "status"], None, capture_output=False)
         tracker.log("\n📁 Current directory contents:", Colors.CYAN)
-        tracker.run_command("ls -la", None, capture_output=False)
+        tracker.run_command(["ls", "-la"], None, capture_output=False)
         if os.path.exists(tracker.log_file):
             tracker.log(f"\n📝 Log file exists: {tracker.log_file}", Colors.GREEN)
         else:
@@ -473,21 +554,36 @@ def main():
             tracker.log("✨ No changes detected. Your book list is up to date!", Colors.GREEN)
             return
     
-    # Detect changes
-    changes = tracker.detect_changes()
-    
-    # Check if any meaningful changes were detected
-    has_meaningful_changes = any(changes[key] for key in changes.keys())
-    
-    if not has_meaningful_changes:
-        tracker.log("📝 Changes detected but no book modifications found. Proceeding with regular commit...", Colors.YELLOW)
-        changes = {key: [] for key in changes.keys()}  # Reset to empty lists
+    # Get commit message (everything except the --quiet flag)
+    quiet = '--quiet' in sys.argv
+    message_args = [arg for arg in sys.argv[1:] if arg != '--quiet']
+    if not message_args:
+        custom_message = None
+    elif len(message_args) == 1:
+        # Usual case of a single quoted message: use it without joining
+        custom_message = message_args[0]
     else:
-        tracker.print_changes_summary(changes)
+        custom_message = ' '.join(message_args)
     
-    # Get commit message
-    custom_message = ' '.join(sys.argv[1:]) if len(sys.argv) > 1 else None
-    commit_message = tracker.generate_commit_message(changes, custom_message)
+    if quiet and custom_message:
+        # Nothing to summarize or log, so skip reading books.md and git history
+        changes = {}
+        has_meaningful_changes = False
+        commit_message = custom_message
+    else:
+        # Detect changes
+        changes = tracker.detect_changes()
+        
+        # Check if any meaningful changes were detected
+        has_meaningful_changes = any(changes.values())
+        
+        if not has_meaningful_changes:
+            tracker.log("📝 Changes detected but no book modifications found. Proceeding with regular commit...", Colors.YELLOW)
+            changes = {key: [] for key in changes}  # Reset to empty lists
+        else:
+            tracker.print_changes_summary(changes)
+        
+        commit_message = tracker.generate_commit_message(changes, custom_message)
     
     tracker.log(f"💬 Commit message: \"{commit_message}\"\n")
     
@@ -496,35 +592,35 @@ def main():
         log_entry = tracker.add_log_entry(changes, commit_message)
         tracker.log(f"📝 Logged changes to {tracker.log_file}", Colors.GREEN)
     
-    # Git workflow steps - only add books.md and books_log.json
-    steps = [
-        (f"git add {tracker.books_file}", "Adding book list changes to staging area"),
-    ]
+    # Git workflow steps - only add books.md and books_log.jsonl
+    files_to_add = [tracker.books_file]
     
     # Add log file if it exists and has meaningful changes
     if has_meaningful_changes and os.path.exists(tracker.log_file):
-        steps.append((f"git add {tracker.log_file}", "Adding log file changes"))
+        files_to_add.append(tracker.log_file)
     
-    steps.extend([
-        (f'git commit -m "{commit_message}"', "Creating commit"),
-        ("git push", "Pushing to GitHub")
-    ])
+    # Commands are passed as argv lists, so the commit message needs no quoting
+    steps = [
+        (["git", "add", *files_to_add], "Adding book list changes to staging area"),
+        (["git", "commit", "-m", commit_message], "Creating commit"),
+        (["git", "push"], "Pushing to GitHub")
+    ]
     
-    # Execute each step
+    # Execute each step, letting git write straight to the terminal; on
+    # failure its own error output is already visible above
     for command, description in steps:
-        result = tracker.run_command(command, description)
+        result = tracker.run_command(command, description, capture_output=False)
+        if result is None and command[1] == "add" and len(files_to_add) > 1:
+            # If adding the log file failed, retry with books.md alone
+            tracker.log("⚠️  Could not add log file, continuing without it...", Colors.YELLOW)
+            result = tracker.run_command(["git", "add", tracker.books_file], None, capture_output=False)
         if result is None:
-            # If it's the log file addition that failed, try without it
-            if "books_log.json" in command:
-                tracker.log("⚠️  Could not add log file, continuing without it...", Colors.YELLOW)
-                continue
-            else:
-                tracker.log("\n❌ Update failed. Please check the error above.", Colors.RED)
-                
-                # Show git status for debugging
-                tracker.log("\n🔍 Current git status:", Colors.CYAN)
-                tracker.run_command("git status", None, capture_output=False)
-                sys.exit(1)
+            tracker.log("\n❌ Update failed. Please check the error above.", Colors.RED)
+            
+            # Show git status for debugging
+            tracker.log("\n🔍 Current git status:", Colors.CYAN)
+            tracker.run_command(["git", "status"], None, capture_output=False)
+            sys.exit(1)
     
     tracker.log("\n✅ Book list updated successfully!", Colors.GREEN)
     tracker.log("🌐 Your changes should be live on GitHub Pages in a few minutes.", Colors.YELLOW)